@@ -2,16 +2,44 @@
 Kuiskaus - Whisper-powered speech-to-text for macOS
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 __author__ = "Kuiskaus Contributors"
 
-from .audio_recorder import AudioRecorder
-from .whisper_transcriber import WhisperTranscriber
-from .parakeet_transcriber import ParakeetTranscriber
-from .voxtral_transcriber import VoxtralTranscriber
-from .transcriber import Transcriber, TranscriptionResult
-from .text_inserter import TextInserter
-from .hotkey_listener import HotkeyListener
+if TYPE_CHECKING:
+    from .audio_recorder import AudioRecorder
+    from .whisper_transcriber import WhisperTranscriber
+    from .parakeet_transcriber import ParakeetTranscriber
+    from .voxtral_transcriber import VoxtralTranscriber
+    from .transcriber import Transcriber, TranscriptionResult
+    from .text_inserter import TextInserter
+    from .hotkey_listener_cgevent import HotkeyListener
+
+# Public names and the submodule that defines each. Submodules pull in
+# PyAudio, MLX and PyObjC, so they are imported on first attribute access
+# (PEP 562) rather than when the package is imported.
+_LAZY_IMPORTS = {
+    "AudioRecorder": ".audio_recorder",
+    "WhisperTranscriber": ".whisper_transcriber",
+    "ParakeetTranscriber": ".parakeet_transcriber",
+    "VoxtralTranscriber": ".voxtral_transcriber",
+    "Transcriber": ".transcriber",
+    "TranscriptionResult": ".transcriber",
+    "TextInserter": ".text_inserter",
+    "HotkeyListener": ".hotkey_listener_cgevent",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "AudioRecorder",
@@ -4,9 +4,10 @@ Kuiskaus - Whisper V3 Turbo Speech-to-Text for macOS
 Hold Control+Option to record, release to transcribe and insert text.
 """
 
+import platform
 import sys
-import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -14,7 +15,7 @@ from .audio_recorder import AudioRecorder
 from .whisper_transcriber import WhisperTranscriber
 from .parakeet_transcriber import ParakeetTranscriber
 from .transcriber import Transcriber
-from .hotkey_listener import HotkeyListener
+from .hotkey_listener_cgevent import HotkeyListenerCGEvent
 from .text_inserter import TextInserter
 from .postprocessor import clean_with_apfel
 
@@ -27,7 +28,16 @@ except ImportError:
     HAS_NOTIFICATIONS = False
 
 
-ALLOWED_MODELS = {"turbo", "base", "small", "medium", "large", "parakeet", "voxtral"}
+ALLOWED_MODELS = {
+    "turbo",
+    "turbo-fp16",
+    "base",
+    "small",
+    "medium",
+    "large",
+    "parakeet",
+    "voxtral",
+}
 
 
 class KuiskausApp:
@@ -58,13 +68,18 @@ class KuiskausApp:
             )
         self.text_inserter = TextInserter()
 
+        # Single worker so transcriptions run one at a time, in order
+        self._tx_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="transcribe"
+        )
+
         # State
         self.is_recording = False
         self.recording_start_time = None
         self.use_apfel = use_apfel
 
         # Initialize hotkey listener with callbacks
-        self.hotkey_listener = HotkeyListener(
+        self.hotkey_listener = HotkeyListenerCGEvent(
             on_press=self.on_hotkey_press, on_release=self.on_hotkey_release
         )
 
@@ -93,18 +108,17 @@ class KuiskausApp:
             audio_data = self.audio_recorder.stop_recording()
 
             if len(audio_data) > 0:
-                # Transcribe in a separate thread to avoid blocking
-                threading.Thread(
-                    target=self._transcribe_and_insert,
-                    args=(audio_data, recording_duration),
-                ).start()
+                # Transcribe on the worker thread to avoid blocking
+                self._tx_pool.submit(
+                    self._transcribe_and_insert, audio_data, recording_duration
+                )
             else:
                 print("No audio recorded")
 
     def _transcribe_and_insert(
         self, audio_data: np.ndarray, recording_duration: float
     ) -> None:
-        """Transcribe audio and insert text (runs in separate thread)"""
+        """Transcribe audio and insert text (runs on the transcription worker)"""
         try:
             print("🤖 Transcribing...")
             self.show_notification("Transcribing", "Processing your speech...")
@@ -191,6 +205,7 @@ class KuiskausApp:
     def cleanup(self):
         """Clean up resources"""
         self.hotkey_listener.stop()
+        self._tx_pool.shutdown(wait=True)
         self.audio_recorder.cleanup()
         self.transcriber.cleanup()
         self.print_stats()
@@ -199,15 +214,7 @@ class KuiskausApp:
 
 def check_apple_silicon():
     """Check if running on Apple Silicon"""
-    try:
-        import subprocess
-
-        result = subprocess.run(
-            ["sysctl", "-n", "machdep.cpu.brand_string"], capture_output=True, text=True
-        )
-        return "Apple" in result.stdout
-    except Exception:
-        return False
+    return platform.machine() == "arm64"
 
 
 def main():
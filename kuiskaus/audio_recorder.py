@@ -1,11 +1,45 @@
 import pyaudio
 import numpy as np
 import threading
-import queue
 import time
 from typing import Optional, Callable
 
+# Initial capture buffer length; grown on demand for longer recordings
+MAX_SECONDS = 30
+
+# PortAudio is initialised once per process and shared by all recorders
+_pa: Optional[pyaudio.PyAudio] = None
+_pa_refs = 0
+_pa_lock = threading.Lock()
+
+
+def _acquire_pyaudio() -> pyaudio.PyAudio:
+    """Return the shared PyAudio instance, initialising PortAudio on first use"""
+    global _pa, _pa_refs
+    with _pa_lock:
+        if _pa is None:
+            _pa = pyaudio.PyAudio()
+        _pa_refs += 1
+        return _pa
+
+
+def _release_pyaudio():
+    """Drop a reference; terminate PortAudio once no recorder uses it"""
+    global _pa, _pa_refs
+    with _pa_lock:
+        _pa_refs -= 1
+        if _pa_refs == 0 and _pa is not None:
+            _pa.terminate()
+            _pa = None
+
+
 class AudioRecorder:
+    """Microphone capture for the transcribers.
+
+    stop_recording() returns C-contiguous float32 mono samples in [-1, 1]
+    at sample_rate (16 kHz by default), which transcribers consume as-is.
+    """
+
     def __init__(self, 
                  sample_rate: int = 16000,  # Whisper expects 16kHz
                  chunk_size: int = 1024,
@@ -13,17 +47,34 @@ class AudioRecorder:
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
         self.channels = channels
-        self.format = pyaudio.paInt16
+        self.format = pyaudio.paFloat32  # Whisper consumes float32 in [-1, 1]
         
-        self.pyaudio = pyaudio.PyAudio()
+        self.pyaudio = _acquire_pyaudio()
+        self._holds_pyaudio = True
         self.stream: Optional[pyaudio.Stream] = None
         self.recording = False
-        self.audio_queue = queue.Queue()
-        self.recording_thread: Optional[threading.Thread] = None
+        # Preallocated float32 capture buffer and its write index
+        self._buf = self._new_buffer()
+        self._widx = 0
         
         # Find the default input device
         self.input_device_index = self._find_default_input_device()
         
+        # Open the stream once and keep it warm; each recording only starts
+        # and stops it instead of paying for device setup on every press.
+        # PortAudio delivers chunks to the callback from its own thread,
+        # so no Python loop blocks on stream.read()
+        self.stream = self.pyaudio.open(
+            format=self.format,
+            channels=self.channels,
+            rate=self.sample_rate,
+            input=True,
+            input_device_index=self.input_device_index,
+            frames_per_buffer=self.chunk_size,
+            stream_callback=self._audio_callback,
+            start=False
+        )
+        
     def _find_default_input_device(self) -> int:
         """Find the default system microphone"""
         try:
@@ -37,56 +88,47 @@ class AudioRecorder:
                     return i
             raise RuntimeError("No input device found")
     
-    def _recording_worker(self):
-        """Worker thread for continuous audio recording"""
-        self.stream = self.pyaudio.open(
-            format=self.format,
-            channels=self.channels,
-            rate=self.sample_rate,
-            input=True,
-            input_device_index=self.input_device_index,
-            frames_per_buffer=self.chunk_size
-        )
-        
-        while self.recording:
-            try:
-                data = self.stream.read(self.chunk_size, exception_on_overflow=False)
-                self.audio_queue.put(data)
-            except Exception as e:
-                print(f"Error recording audio: {e}")
-                break
-        
-        self.stream.stop_stream()
-        self.stream.close()
-        self.stream = None
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio callback: copy each captured chunk into the buffer"""
+        self._write(np.frombuffer(in_data, dtype=np.float32))
+        return (None, pyaudio.paContinue)
     
+    def _new_buffer(self) -> np.ndarray:
+        """Allocate an empty capture buffer for MAX_SECONDS of audio"""
+        return np.empty(MAX_SECONDS * self.sample_rate * self.channels, dtype=np.float32)
+    
+    def _write(self, chunk: np.ndarray):
+        """Append a chunk of samples to the capture buffer"""
+        w = self._widx
+        n = len(chunk)
+        if w + n > len(self._buf):
+            # Double the buffer; only hit for recordings beyond MAX_SECONDS
+            grown = np.empty(max(2 * len(self._buf), w + n), dtype=np.float32)
+            grown[:w] = self._buf[:w]
+            self._buf = grown
+        self._buf[w:w + n] = chunk
+        self._widx = w + n
+
     def start_recording(self):
         """Start recording audio"""
-        if not self.recording:
+        if not self.recording and self.stream:
             self.recording = True
-            self.audio_queue = queue.Queue()  # Clear any old data
-            self.recording_thread = threading.Thread(target=self._recording_worker)
-            self.recording_thread.start()
+            # Fresh buffer so audio returned by the last stop_recording()
+            # stays valid while it is being transcribed
+            self._buf = self._new_buffer()
+            self._widx = 0
+            self.stream.start_stream()
             
     def stop_recording(self) -> np.ndarray:
         """Stop recording and return the audio data as numpy array"""
         if self.recording:
             self.recording = False
-            if self.recording_thread:
-                self.recording_thread.join(timeout=1.0)
-            
-            # Collect all audio data
-            audio_chunks = []
-            while not self.audio_queue.empty():
-                audio_chunks.append(self.audio_queue.get())
+            if self.stream:
+                self.stream.stop_stream()
             
-            if audio_chunks:
-                # Convert to numpy array
-                audio_data = b''.join(audio_chunks)
-                audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                # Convert to float32 and normalize
-                audio_float = audio_array.astype(np.float32) / 32768.0
-                return audio_float
+            if self._widx:
+                # Already float32 in [-1, 1]; hand back a view, no conversion
+                return self._buf[:self._widx]
             
         return np.array([], dtype=np.float32)
     
@@ -94,7 +136,12 @@ class AudioRecorder:
         """Clean up PyAudio resources"""
         if self.recording:
             self.stop_recording()
-        self.pyaudio.terminate()
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if self._holds_pyaudio:
+            self._holds_pyaudio = False
+            _release_pyaudio()
         
     def __del__(self):
         """Ensure cleanup on deletion"""
@@ -1,8 +1,23 @@
 import Quartz
 from AppKit import NSEvent
+from PyObjCTools import AppHelper
+import logging
+import queue
 import threading
 from typing import Callable, Optional
 
+logger = logging.getLogger(__name__)
+
+# CGEventFlags values
+kCGEventFlagMaskControl = 1 << 18
+kCGEventFlagMaskAlternate = 1 << 19  # Option key
+kCGEventFlagMaskCommand = 1 << 20
+
+# Hotkey is Control+Option with Command NOT pressed (to avoid conflicts),
+# checked as a single masked comparison
+HOTKEY_MASK = kCGEventFlagMaskControl | kCGEventFlagMaskAlternate | kCGEventFlagMaskCommand
+HOTKEY_FLAGS = kCGEventFlagMaskControl | kCGEventFlagMaskAlternate
+
 class HotkeyListenerCGEvent:
     def __init__(self, on_press: Callable[[], None], on_release: Callable[[], None]):
         """
@@ -21,52 +36,63 @@ class HotkeyListenerCGEvent:
         self.run_loop_source = None
         self.running = False
         
+        # Callbacks run in order on one persistent worker thread so the
+        # event handler never blocks and press/release cannot race
+        self._callback_thread = None
+        self._start_callback_worker()
+        
+    def _start_callback_worker(self):
+        """Start a callback worker with its own queue"""
+        self._callback_queue = queue.SimpleQueue()
+        self._callback_thread = threading.Thread(
+            target=self._callback_worker, args=(self._callback_queue,), daemon=True
+        )
+        self._callback_thread.start()
+    
+    def _callback_worker(self, callbacks: queue.SimpleQueue):
+        """Run queued hotkey callbacks off the event thread"""
+        while True:
+            callback = callbacks.get()
+            if callback is None:  # Sentinel from stop()
+                return
+            try:
+                callback()
+            except Exception:
+                logger.exception("Error in hotkey callback")
+    
     def _check_modifiers(self, flags: int) -> bool:
         """Check if the required modifier keys are pressed"""
-        # CGEventFlags values
-        kCGEventFlagMaskControl = 1 << 18
-        kCGEventFlagMaskAlternate = 1 << 19  # Option key
-        kCGEventFlagMaskCommand = 1 << 20
-        
-        # Check Control key
-        has_control = bool(flags & kCGEventFlagMaskControl)
-        # Check Option key
-        has_option = bool(flags & kCGEventFlagMaskAlternate)
-        # Check that Command is NOT pressed (to avoid conflicts)
-        has_command = bool(flags & kCGEventFlagMaskCommand)
-        
-        return has_control and has_option and not has_command
+        return (flags & HOTKEY_MASK) == HOTKEY_FLAGS
     
     def _event_tap_callback(self, proxy, type_, event, refcon):
         """CGEventTap callback"""
         try:
-            # Check if it's a flags changed event
-            if type_ == Quartz.kCGEventFlagsChanged:
-                flags = Quartz.CGEventGetFlags(event)
-                modifiers_pressed = self._check_modifiers(flags)
-                
-                # Debug output
-                if flags != 0:
-                    print(f"[DEBUG CGEvent] Modifier flags: {flags}, Control+Option pressed: {modifiers_pressed}")
-                
-                if modifiers_pressed and not self.is_pressed:
-                    # Hotkey pressed
-                    print("[DEBUG CGEvent] Hotkey pressed!")
-                    self.is_pressed = True
-                    if self.on_press:
-                        # Run callback in separate thread to avoid blocking
-                        threading.Thread(target=self.on_press).start()
-                        
-                elif not modifiers_pressed and self.is_pressed:
-                    # Hotkey released
-                    print("[DEBUG CGEvent] Hotkey released!")
-                    self.is_pressed = False
-                    if self.on_release:
-                        # Run callback in separate thread to avoid blocking
-                        threading.Thread(target=self.on_release).start()
+            # Only flags changed events matter; skip anything else before
+            # making any bridged call
+            if type_ != Quartz.kCGEventFlagsChanged:
+                return event
+            
+            flags = Quartz.CGEventGetFlags(event)
+            modifiers_pressed = self._check_modifiers(flags)
+            
+            logger.debug("Modifier flags: %s, Control+Option pressed: %s", flags, modifiers_pressed)
+            
+            if modifiers_pressed and not self.is_pressed:
+                # Hotkey pressed
+                logger.debug("Hotkey pressed")
+                self.is_pressed = True
+                if self.on_press:
+                    self._callback_queue.put(self.on_press)
+                    
+            elif not modifiers_pressed and self.is_pressed:
+                # Hotkey released
+                logger.debug("Hotkey released")
+                self.is_pressed = False
+                if self.on_release:
+                    self._callback_queue.put(self.on_release)
             
         except Exception as e:
-            print(f"Error in event tap callback: {e}")
+            logger.error("Error in event tap callback: %s", e)
         
         # Return the event to continue processing
         return event
@@ -75,6 +101,8 @@ class HotkeyListenerCGEvent:
         """Start listening for hotkeys"""
         if not self.running:
             self.running = True
+            if self._callback_thread is None:
+                self._start_callback_worker()
             
             # Check accessibility permissions
             from ApplicationServices import AXIsProcessTrusted
@@ -85,7 +113,7 @@ class HotkeyListenerCGEvent:
                 print("Please grant accessibility permissions in System Preferences > Security & Privacy > Accessibility")
                 return False
             
-            print("[DEBUG CGEvent] Creating CGEventTap...")
+            logger.debug("Creating CGEventTap")
             
             # Create event tap
             self.tap = Quartz.CGEventTapCreate(
@@ -98,10 +126,10 @@ class HotkeyListenerCGEvent:
             )
             
             if not self.tap:
-                print("[DEBUG CGEvent] Failed to create CGEventTap!")
+                logger.error("Failed to create CGEventTap")
                 return False
             
-            print("[DEBUG CGEvent] CGEventTap created successfully")
+            logger.debug("CGEventTap created successfully")
             
             # Create run loop source
             self.run_loop_source = Quartz.CFMachPortCreateRunLoopSource(None, self.tap, 0)
@@ -116,7 +144,7 @@ class HotkeyListenerCGEvent:
             # Enable the tap
             Quartz.CGEventTapEnable(self.tap, True)
             
-            print("[DEBUG CGEvent] Hotkey listener started. Press Control+Option (⌃⌥) to record.")
+            print("Hotkey listener started. Press Control+Option (⌃⌥) to record.")
             return True
     
     def stop(self):
@@ -135,15 +163,25 @@ class HotkeyListenerCGEvent:
             
             self.running = False
             self.is_pressed = False
-            print("[DEBUG CGEvent] Hotkey listener stopped.")
+            print("Hotkey listener stopped.")
+        
+        # End the callback worker once already-queued callbacks have run
+        if self._callback_thread is not None:
+            self._callback_queue.put(None)
+            self._callback_thread = None
     
     def run_loop(self):
         """Run the event loop (blocks) - for CLI app"""
+        # Unlike a bare CFRunLoopRun(), the console loop stops on Ctrl+C
         try:
-            Quartz.CFRunLoopRun()
+            AppHelper.runConsoleEventLoop(installInterrupt=True)
         except KeyboardInterrupt:
             self.stop()
     
     def stop_loop(self):
         """Stop the event loop"""
-        Quartz.CFRunLoopStop(Quartz.CFRunLoopGetCurrent())
\ No newline at end of file
+        AppHelper.stopEventLoop()
+
+
+# Default listener exported by the package
+HotkeyListener = HotkeyListenerCGEvent
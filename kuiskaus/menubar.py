@@ -4,9 +4,11 @@ Kuiskaus Menu Bar App - Whisper V3 Turbo Speech-to-Text for macOS
 A menu bar application for easy access to speech-to-text functionality.
 """
 
+import platform
 import rumps
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import numpy as np
@@ -19,6 +21,9 @@ from .hotkey_listener_cgevent import HotkeyListenerCGEvent
 from .text_inserter import TextInserter
 from .postprocessor import clean_with_apfel
 
+# Peak amplitude below which a recording is treated as silence
+_SILENCE_THRESHOLD = 0.005
+
 
 class KuiskausMenuBarApp(rumps.App):
     def __init__(self):
@@ -44,6 +49,12 @@ class KuiskausMenuBarApp(rumps.App):
         self.enabled = True
         self.use_apfel: bool = False
         self._apfel_lock = threading.Lock()
+        # One worker runs transcriptions and model reloads in order; a reload
+        # returns only once the new model is loaded, so two MLX workloads
+        # never compete for the GPU
+        self._work_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="transcribe"
+        )
 
         # Initialize hotkey listener with CGEventTap
         self.hotkey_listener = HotkeyListenerCGEvent(
@@ -53,6 +64,7 @@ class KuiskausMenuBarApp(rumps.App):
         # Stats
         self.total_transcriptions = 0
         self.total_recording_time = 0.0
+        self._avg_recording = 0.0
         self.session_start = datetime.now()
 
         # Setup menu
@@ -202,19 +214,21 @@ class KuiskausMenuBarApp(rumps.App):
             # Stop recording and get audio
             audio_data = self.audio_recorder.stop_recording()
 
-            if len(audio_data) > 0:
-                # Transcribe in a separate thread
-                threading.Thread(
-                    target=self._transcribe_and_insert,
-                    args=(audio_data, recording_duration),
-                ).start()
-            else:
+            if len(audio_data) == 0:
                 self.update_status("🟢 Ready")
+            elif float(np.abs(audio_data).max()) < _SILENCE_THRESHOLD:
+                # Skip the model entirely for accidental taps
+                self.update_status("🟢 Ready (silent)")
+            else:
+                # Transcribe on the worker thread
+                self._work_pool.submit(
+                    self._transcribe_and_insert, audio_data, recording_duration
+                )
 
     def _transcribe_and_insert(
         self, audio_data: np.ndarray, recording_duration: float
     ) -> None:
-        """Transcribe audio and insert text (runs in separate thread)"""
+        """Transcribe audio and insert text (runs on the worker thread)"""
         try:
             # Transcribe
             result = self.transcriber.transcribe(audio_data)
@@ -230,6 +244,9 @@ class KuiskausMenuBarApp(rumps.App):
                 # Update stats
                 self.total_transcriptions += 1
                 self.total_recording_time += recording_duration
+                self._avg_recording += (
+                    recording_duration - self._avg_recording
+                ) / self.total_transcriptions
 
                 # Insert text
                 self.text_inserter.insert_text(text)
@@ -254,27 +271,32 @@ class KuiskausMenuBarApp(rumps.App):
         self.update_status(f"Loading {model_name} model...")
 
         # Reload transcriber with new model
-        threading.Thread(target=self._reload_model, args=(model_name,)).start()
+        self._work_pool.submit(self._reload_model, model_name)
 
     def _reload_model(self, model_name: str):
-        """Reload the model in background"""
+        """Reload the model on the worker thread"""
         try:
-            old_transcriber = self.transcriber
+            # Build the new transcriber before swapping it in, so an
+            # in-flight transcription keeps using the old one. Each backend
+            # loads on its own thread; wait for it here so the load (and
+            # Whisper's warm-up) finishes before this worker moves on
             if model_name == "parakeet":
-                self.transcriber: Transcriber = ParakeetTranscriber()
+                transcriber = ParakeetTranscriber()
+                transcriber._ensure_loaded()
             elif model_name == "voxtral":
                 from .voxtral_transcriber import VoxtralTranscriber
 
-                self.transcriber: Transcriber = VoxtralTranscriber()
+                transcriber = VoxtralTranscriber()
+                transcriber._ensure_loaded()
             else:
-                self.transcriber: Transcriber = WhisperTranscriber(
-                    model_name=model_name
-                )
-            if not isinstance(self.transcriber, Transcriber):
+                transcriber = WhisperTranscriber(model_name=model_name)
+                transcriber.ensure_model_loaded()
+            if not isinstance(transcriber, Transcriber):
                 raise TypeError(
-                    f"Transcriber implementation {type(self.transcriber)} does not satisfy "
+                    f"Transcriber implementation {type(transcriber)} does not satisfy "
                     "the Transcriber protocol"
                 )
+            old_transcriber, self.transcriber = self.transcriber, transcriber
             old_transcriber.cleanup()
 
             self.update_status("🟢 Ready")
@@ -293,7 +315,7 @@ class KuiskausMenuBarApp(rumps.App):
         stats_text = f"""Session Duration: {hours}h {minutes}m
 Total Transcriptions: {self.total_transcriptions}
 Total Recording Time: {self.total_recording_time:.1f}s
-Average Recording: {self.total_recording_time / max(1, self.total_transcriptions):.1f}s"""
+Average Recording: {self._avg_recording:.1f}s"""
 
         rumps.alert("Kuiskaus Statistics", stats_text)
 
@@ -333,6 +355,7 @@ Version 1.0
         """Clean up resources"""
         try:
             self.hotkey_listener.stop()
+            self._work_pool.shutdown(wait=True)
             self.audio_recorder.cleanup()
             self.transcriber.cleanup()
         except Exception as e:
@@ -341,15 +364,7 @@ Version 1.0
 
 def check_apple_silicon():
     """Check if running on Apple Silicon"""
-    try:
-        import subprocess
-
-        result = subprocess.run(
-            ["sysctl", "-n", "machdep.cpu.brand_string"], capture_output=True, text=True
-        )
-        return "Apple" in result.stdout
-    except Exception:
-        return False
+    return platform.machine() == "arm64"
 
 
 def main():
@@ -7,23 +7,33 @@ class TextInserter:
     def __init__(self):
         """Initialize text inserter"""
         self.insert_lock = threading.Lock()
+        # Reuse one event source for every synthesized key event
+        self._event_source = Quartz.CGEventSourceCreate(
+            Quartz.kCGEventSourceStateHIDSystemState
+        )
         
-    def insert_text_typing(self, text: str, delay: float = 0.001):
+    def insert_text_typing(self, text: str):
         """
         Insert text by simulating keyboard typing
         
         Args:
             text: Text to insert
-            delay: Delay between keystrokes (seconds)
         """
         with self.insert_lock:
             # Small delay to ensure we're ready
             time.sleep(0.1)
             
-            for char in text:
-                self._type_character(char)
-                if delay > 0:
-                    time.sleep(delay)
+            # One key event pair carries a whole chunk; macOS drops anything
+            # past 20 UTF-16 code units (40 bytes) per event
+            data = text.encode("utf-16-le")
+            i = 0
+            while i < len(data):
+                j = min(i + 40, len(data))
+                # Don't split a surrogate pair (e.g. an emoji) across events
+                if j < len(data) and 0xD8 <= data[j - 1] <= 0xDB:
+                    j -= 2
+                self._type_string(data[i:j].decode("utf-16-le"))
+                i = j
     
     def insert_text_paste(self, text: str):
         """
@@ -38,17 +48,16 @@ class TextInserter:
             old_content = pasteboard.stringForType_(NSPasteboardTypeString)
             
             try:
-                # Set new clipboard content
+                # Set new clipboard content (the write is synchronous, so
+                # the paste can follow immediately)
                 pasteboard.clearContents()
                 pasteboard.setString_forType_(text, NSPasteboardTypeString)
                 
-                # Small delay to ensure clipboard is updated
-                time.sleep(0.05)
-                
                 # Simulate Cmd+V
                 self._simulate_paste()
                 
-                # Small delay to ensure paste completes
+                # Small delay to ensure paste completes (the target app
+                # reads the pasteboard asynchronously and nothing signals it)
                 time.sleep(0.1)
                 
             finally:
@@ -57,19 +66,19 @@ class TextInserter:
                     pasteboard.clearContents()
                     pasteboard.setString_forType_(old_content, NSPasteboardTypeString)
     
-    def _type_character(self, char: str):
-        """Type a single character"""
-        # Get the Unicode value
-        unicode_value = ord(char)
+    def _type_string(self, chars: str):
+        """Type a short string with a single key down/up pair"""
+        # The length is in UTF-16 code units, not Python characters
+        length = len(chars.encode("utf-16-le")) // 2
         
         # Create key down event
-        event = Quartz.CGEventCreateKeyboardEvent(None, 0, True)
-        Quartz.CGEventKeyboardSetUnicodeString(event, len(char), char)
+        event = Quartz.CGEventCreateKeyboardEvent(self._event_source, 0, True)
+        Quartz.CGEventKeyboardSetUnicodeString(event, length, chars)
         Quartz.CGEventPost(Quartz.kCGSessionEventTap, event)
         
         # Create key up event
-        event = Quartz.CGEventCreateKeyboardEvent(None, 0, False)
-        Quartz.CGEventKeyboardSetUnicodeString(event, len(char), char)
+        event = Quartz.CGEventCreateKeyboardEvent(self._event_source, 0, False)
+        Quartz.CGEventKeyboardSetUnicodeString(event, length, chars)
         Quartz.CGEventPost(Quartz.kCGSessionEventTap, event)
     
     def _simulate_paste(self):
@@ -78,22 +87,22 @@ class TextInserter:
         v_key = 9
         
         # Press Cmd key
-        cmd_down = Quartz.CGEventCreateKeyboardEvent(None, 0x37, True)  # 0x37 is Command key
+        cmd_down = Quartz.CGEventCreateKeyboardEvent(self._event_source, 0x37, True)  # 0x37 is Command key
         Quartz.CGEventSetFlags(cmd_down, Quartz.kCGEventFlagMaskCommand)
         Quartz.CGEventPost(Quartz.kCGSessionEventTap, cmd_down)
         
         # Press 'v' with Cmd held
-        v_down = Quartz.CGEventCreateKeyboardEvent(None, v_key, True)
+        v_down = Quartz.CGEventCreateKeyboardEvent(self._event_source, v_key, True)
         Quartz.CGEventSetFlags(v_down, Quartz.kCGEventFlagMaskCommand)
         Quartz.CGEventPost(Quartz.kCGSessionEventTap, v_down)
         
         # Release 'v'
-        v_up = Quartz.CGEventCreateKeyboardEvent(None, v_key, False)
+        v_up = Quartz.CGEventCreateKeyboardEvent(self._event_source, v_key, False)
         Quartz.CGEventSetFlags(v_up, Quartz.kCGEventFlagMaskCommand)
         Quartz.CGEventPost(Quartz.kCGSessionEventTap, v_up)
         
         # Release Cmd
-        cmd_up = Quartz.CGEventCreateKeyboardEvent(None, 0x37, False)
+        cmd_up = Quartz.CGEventCreateKeyboardEvent(self._event_source, 0x37, False)
         Quartz.CGEventPost(Quartz.kCGSessionEventTap, cmd_up)
     
     def insert_text(self, text: str, use_paste: bool = True):
@@ -102,7 +111,7 @@ class TextInserter:
         
         Args:
             text: Text to insert
-            use_paste: If True, use clipboard paste (faster). If False, type character by character.
+            use_paste: If True, use clipboard paste (faster). If False, simulate typing.
         """
         if not text:
             return
@@ -2,7 +2,9 @@ import numpy as np
 import time
 from typing import Optional
 import threading
+import mlx.core as mx
 import mlx_whisper
+from mlx_whisper.transcribe import ModelHolder
 from .transcriber import TranscriptionResult
 
 
@@ -12,21 +14,42 @@ class WhisperTranscriber:
         Initialize Whisper transcriber for Apple Silicon
 
         Args:
-            model_name: Model size - for V3 Turbo use "turbo"
+            model_name: Model size - for V3 Turbo use "turbo" (4-bit) or
+                "turbo-fp16" (full precision)
             device: Ignored (kept for API compatibility)
         """
         self.model_name = model_name
         self.model = None
         self.model_lock = threading.Lock()
+        # Whisper expects at least 0.1 seconds; short clips are padded into
+        # this buffer rather than a fresh np.pad allocation per call
+        self._pad_buf = np.zeros(int(0.1 * 16000), dtype=np.float32)
+        # Default MLX whisper parameters, overridden by transcribe() kwargs
+        self._default_mlx_kwargs = {
+            "verbose": False,
+            "temperature": 0.0,
+            "compression_ratio_threshold": 2.4,
+            "logprob_threshold": -1.0,
+            "no_speech_threshold": 0.6,
+        }
 
-        # Map model names to MLX model paths
+        # Map model names to MLX model paths. Turbo defaults to 4-bit
+        # weights: decoding is memory-bandwidth bound on Apple Silicon
         self.model_paths = {
-            "turbo": "mlx-community/whisper-large-v3-turbo",
+            "turbo": "mlx-community/whisper-large-v3-turbo-q4",
+            "turbo-fp16": "mlx-community/whisper-large-v3-turbo",
             "base": "mlx-community/whisper-base",
             "small": "mlx-community/whisper-small",
             "medium": "mlx-community/whisper-medium",
             "large": "mlx-community/whisper-large-v3",
         }
+        # Resolved once; transcribe() passes it to mlx_whisper on every call
+        self.model_path = self.model_paths.get(
+            model_name, f"mlx-community/whisper-{model_name}"
+        )
+
+        # Set once _load_model finishes, whether or not it succeeded
+        self._loaded = threading.Event()
 
         # Load model in background
         self.load_thread = threading.Thread(target=self._load_model)
@@ -34,24 +57,37 @@ class WhisperTranscriber:
 
     def _load_model(self):
         """Load the MLX-optimized Whisper model"""
-        print(f"Loading Whisper model: {self.model_name}")
-        print("Using MLX-optimized Whisper for Apple Silicon")
-        start_time = time.time()
+        try:
+            print(f"Loading Whisper model: {self.model_name}")
+            print("Using MLX-optimized Whisper for Apple Silicon")
+            start_time = time.time()
 
-        with self.model_lock:
-            model_path = self.model_paths.get(
-                self.model_name, f"mlx-community/whisper-{self.model_name}"
+            # Load through mlx_whisper's model cache so transcribe() reuses
+            # these weights instead of loading them again on first use. Build
+            # outside the lock and only hold it for the swap
+            model = ModelHolder.get_model(self.model_path, mx.float16)
+            with self.model_lock:
+                self.model = model
+
+            # Warm-up pass so the first real transcription doesn't pay for
+            # kernel compilation and weight paging. Same decoding settings
+            # as real calls: one greedy decode, no temperature fallback
+            mlx_whisper.transcribe(
+                np.zeros(len(self._pad_buf), dtype=np.float32),
+                path_or_hf_repo=self.model_path,
+                **{**self._default_mlx_kwargs, "verbose": None},
             )
-            self.model = mlx_whisper.load_models.load_model(model_path)
 
-        load_time = time.time() - start_time
-        print(f"Model loaded in {load_time:.2f} seconds")
+            load_time = time.time() - start_time
+            print(f"Model loaded in {load_time:.2f} seconds")
+        finally:
+            self._loaded.set()
 
     def ensure_model_loaded(self):
         """Ensure the model is loaded before transcription"""
-        if self.load_thread.is_alive():
+        if not self._loaded.is_set():
             print("Waiting for model to load...")
-            self.load_thread.join()
+            self._loaded.wait()
 
     def transcribe(
         self,
@@ -77,56 +113,44 @@ class WhisperTranscriber:
         if len(audio) == 0:
             return {"text": "", "segments": [], "language": "en"}
 
-        # Ensure audio is the right format
-        if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
+        # Ensure audio is the right format (no copy for AudioRecorder's
+        # C-contiguous float32 output)
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
 
         # Pad audio if too short (Whisper expects at least 0.1 seconds)
-        min_length = int(0.1 * 16000)  # 0.1 seconds at 16kHz
-        if len(audio) < min_length:
-            audio = np.pad(audio, (0, min_length - len(audio)), mode="constant")
+        if len(audio) < len(self._pad_buf):
+            self._pad_buf[: len(audio)] = audio
+            self._pad_buf[len(audio) :] = 0.0
+            audio = self._pad_buf
 
-        with self.model_lock:
-            start_time = time.time()
+        start_time = time.time()
 
-            # Get model path for transcription
-            model_path = self.model_paths.get(
-                self.model_name, f"mlx-community/whisper-{self.model_name}"
-            )
+        # MLX whisper parameters
+        mlx_kwargs = (
+            {**self._default_mlx_kwargs, **kwargs}
+            if kwargs
+            else self._default_mlx_kwargs
+        )
 
-            # MLX whisper parameters
-            mlx_kwargs = {
-                "verbose": kwargs.get("verbose", False),
-                "temperature": kwargs.get("temperature", 0.0),
-                "compression_ratio_threshold": kwargs.get(
-                    "compression_ratio_threshold", 2.4
-                ),
-                "logprob_threshold": kwargs.get("logprob_threshold", -1.0),
-                "no_speech_threshold": kwargs.get("no_speech_threshold", 0.6),
-            }
-
-            result = mlx_whisper.transcribe(
-                audio,
-                path_or_hf_repo=model_path,
-                language=language,
-                task=task,
-                **mlx_kwargs,
-            )
+        result = mlx_whisper.transcribe(
+            audio,
+            path_or_hf_repo=self.model_path,
+            language=language,
+            task=task,
+            **mlx_kwargs,
+        )
 
-            transcribe_time = time.time() - start_time
+        transcribe_time = time.time() - start_time
 
-            # Add timing information
-            result["transcribe_time"] = transcribe_time
-            result["audio_duration"] = len(audio) / 16000.0
-            result["rtf"] = (
-                transcribe_time / result["audio_duration"]
-            )  # Real-time factor
+        # Add timing information
+        result["transcribe_time"] = transcribe_time
+        result["audio_duration"] = len(audio) / 16000.0
+        result["rtf"] = transcribe_time / result["audio_duration"]  # Real-time factor
 
-            return result
+        return result
 
     def cleanup(self):
         """Clean up resources"""
         # MLX models don't need explicit cleanup
-        if self.model:
-            del self.model
+        with self.model_lock:
             self.model = None
@@ -0,0 +1,16 @@
+"""Cached system probes shared by the diagnostic scripts."""
+
+import functools
+import subprocess
+
+
+@functools.lru_cache(maxsize=None)
+def sysctl(name: str) -> str:
+    """Return `sysctl -n <name>`; the value is fixed for the process lifetime"""
+    return subprocess.check_output(["sysctl", "-n", name], text=True).strip()
+
+
+@functools.lru_cache(maxsize=None)
+def sw_vers(key: str) -> str:
+    """Return `sw_vers -<key>`, e.g. sw_vers("productVersion")"""
+    return subprocess.check_output(["sw_vers", f"-{key}"], text=True).strip()
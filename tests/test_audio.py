@@ -4,17 +4,53 @@ Simple audio recording test to verify microphone access and PyAudio functionalit
 Run this to troubleshoot audio recording issues.
 """
 
-import pyaudio
+import atexit
 import numpy as np
 import time
 import sys
+from numba import njit, types
+
+# Pre-rendered volume bars, indexed by level (one '=' per 100 in amplitude)
+_BARS = [("=" * i).ljust(50) for i in range(51)]
+
+# One PortAudio session shared by every test in this file
+_PA = None
+
+def _pa():
+    """Return the shared PyAudio instance, creating it on first use"""
+    global _PA
+    if _PA is None:
+        import pyaudio
+        
+        _PA = pyaudio.PyAudio()
+        atexit.register(_PA.terminate)
+    return _PA
+
+# Explicit signature so the kernel compiles at import, not on the first
+# chunk; frombuffer views are read-only, hence the readonly array type
+_I16_CHUNK = types.Array(types.int16, 1, "C", readonly=True)
+
+@njit(types.UniTuple(types.int64, 2)(_I16_CHUNK), fastmath=True)
+def meanabs_maxabs(x):
+    """Mean and peak absolute amplitude of an int16 chunk in one pass"""
+    s = 0
+    m = 0
+    for i in range(x.shape[0]):
+        v = np.int64(x[i])
+        av = -v if v < 0 else v
+        s += av
+        if av > m:
+            m = av
+    return s // x.shape[0], m
 
 def test_audio_devices():
     """List all available audio devices"""
     print("=== Audio Devices Test ===\n")
     
     try:
-        p = pyaudio.PyAudio()
+        import pyaudio
+        
+        p = _pa()
         print(f"PyAudio version: {pyaudio.__version__}")
         print(f"Number of devices: {p.get_device_count()}\n")
         
@@ -34,8 +70,6 @@ def test_audio_devices():
                 print(f"  - Sample Rate: {info['defaultSampleRate']}")
                 print()
         
-        p.terminate()
-        
         if not input_devices:
             print("❌ No input devices found!")
             return False
@@ -47,12 +81,14 @@ def test_audio_devices():
         print(f"❌ Error initializing PyAudio: {e}")
         return False
 
-def test_recording(duration=3):
+def test_recording(duration=3, chunk=4096):
     """Test recording audio for a specified duration"""
     print(f"\n=== Recording Test ({duration} seconds) ===\n")
     
     try:
-        p = pyaudio.PyAudio()
+        import pyaudio
+        
+        p = _pa()
         
         # Use default input device
         stream = p.open(
@@ -60,33 +96,37 @@ def test_recording(duration=3):
             channels=1,
             rate=16000,
             input=True,
-            frames_per_buffer=1024
+            frames_per_buffer=chunk
         )
         
+        # Only draw the live meter for a terminal, not redirected output
+        show_meter = sys.stdout.isatty()
+        
         print("🎤 Recording... (speak into your microphone)")
-        frames = []
+        max_volume = 0
+        # Local aliases keep attribute lookups out of the read loop
+        read = stream.read
+        frombuffer = np.frombuffer
+        int16 = np.int16
         
-        for i in range(0, int(16000 / 1024 * duration)):
-            data = stream.read(1024, exception_on_overflow=False)
-            frames.append(data)
+        for i in range(0, int(16000 / chunk * duration)):
+            data = read(chunk, exception_on_overflow=False)
+            volume, peak = meanabs_maxabs(frombuffer(data, dtype=int16))
+            max_volume = max(max_volume, peak)
             
             # Show volume level
-            audio_data = np.frombuffer(data, dtype=np.int16)
-            volume = np.abs(audio_data).mean()
-            bar = '=' * int(volume / 100)
-            print(f"\rVolume: [{bar:<50}] {volume:5.0f}", end='', flush=True)
+            if show_meter:
+                bar = _BARS[min(volume // 100, 50)]
+                print(f"\rVolume: [{bar}] {volume:5.0f}", end='', flush=True)
         
-        print("\n✅ Recording complete!")
+        if show_meter:
+            print()
+        print("✅ Recording complete!")
         
         stream.stop_stream()
         stream.close()
-        p.terminate()
         
         # Check if we got any audio
-        all_data = b''.join(frames)
-        audio_array = np.frombuffer(all_data, dtype=np.int16)
-        max_volume = np.abs(audio_array).max()
-        
         if max_volume < 100:
             print("⚠️  Warning: Very low audio levels detected. Check your microphone.")
             return False
@@ -0,0 +1,125 @@
+"""Tests for AudioRecorder capture buffer handling."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+sys.modules["pyaudio"] = MagicMock()
+sys.modules["mlx_whisper"] = MagicMock()
+sys.modules["mlx_whisper.load_models"] = MagicMock()
+
+# ruff: noqa: E402 - Module import must come after mocks
+import kuiskaus.audio_recorder as audio_recorder
+from kuiskaus.audio_recorder import AudioRecorder
+
+
+class TestAudioRecorderBuffer:
+    def _make_recorder(self):
+        recorder = AudioRecorder()
+        recorder.recording = True
+        return recorder
+
+    def test_write_appends_samples(self):
+        r = self._make_recorder()
+        r._write(np.arange(4, dtype=np.float32))
+        r._write(np.arange(4, 8, dtype=np.float32))
+        assert r._widx == 8
+        assert list(r._buf[:8]) == list(range(8))
+
+    def test_write_grows_buffer_when_full(self):
+        r = self._make_recorder()
+        r._buf = np.empty(4, dtype=np.float32)
+        r._write(np.arange(3, dtype=np.float32))
+        r._write(np.arange(3, 6, dtype=np.float32))
+        assert len(r._buf) >= 6
+        assert list(r._buf[:6]) == list(range(6))
+
+    def test_audio_callback_writes_chunk(self):
+        r = self._make_recorder()
+        r._audio_callback(np.arange(4, dtype=np.float32).tobytes(), 4, None, 0)
+        assert r._widx == 4
+        assert list(r._buf[:4]) == list(range(4))
+
+    def test_stop_recording_returns_float32_samples(self):
+        r = self._make_recorder()
+        r._write(np.array([0.0, 0.5, -1.0], dtype=np.float32))
+        audio = r.stop_recording()
+        assert audio.dtype == np.float32
+        assert list(audio) == [0.0, 0.5, -1.0]
+
+    def test_stop_recording_without_audio_returns_empty(self):
+        r = self._make_recorder()
+        audio = r.stop_recording()
+        assert audio.dtype == np.float32
+        assert len(audio) == 0
+
+    def test_start_recording_discards_previous_audio(self):
+        r = AudioRecorder()
+        r._write(np.arange(4, dtype=np.float32))
+        r.start_recording()
+        assert r._widx == 0
+        r.stop_recording()
+
+    def test_returned_audio_survives_next_recording(self):
+        r = self._make_recorder()
+        r._write(np.array([0.25, 0.5], dtype=np.float32))
+        audio = r.stop_recording()
+        r.start_recording()
+        r._write(np.array([-1.0, -1.0], dtype=np.float32))
+        assert list(audio) == [0.25, 0.5]
+        r.recording = False
+
+    def test_stream_is_reused_across_recordings(self):
+        r = AudioRecorder()
+        stream = r.stream = MagicMock()
+        for _ in range(2):
+            r.start_recording()
+            r.stop_recording()
+        assert stream.start_stream.call_count == 2
+        assert stream.stop_stream.call_count == 2
+        stream.close.assert_not_called()
+
+    def test_cleanup_closes_stream(self):
+        r = AudioRecorder()
+        stream = r.stream = MagicMock()
+        r.cleanup()
+        stream.close.assert_called_once()
+        assert r.stream is None
+
+
+class TestSharedPyAudio:
+    def setup_method(self):
+        # Isolate from recorders created (and not yet collected) elsewhere
+        self._patches = [
+            patch.object(audio_recorder, "_pa", None),
+            patch.object(audio_recorder, "_pa_refs", 0),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in self._patches:
+            p.stop()
+
+    def test_recorders_share_one_pyaudio_instance(self):
+        with patch.object(audio_recorder.pyaudio, "PyAudio") as pyaudio_cls:
+            a = AudioRecorder()
+            b = AudioRecorder()
+            assert a.pyaudio is b.pyaudio
+            pyaudio_cls.assert_called_once()
+
+            a.cleanup()
+            pyaudio_cls.return_value.terminate.assert_not_called()
+            b.cleanup()
+            pyaudio_cls.return_value.terminate.assert_called_once()
+
+    def test_cleanup_twice_releases_once(self):
+        with patch.object(audio_recorder.pyaudio, "PyAudio") as pyaudio_cls:
+            a = AudioRecorder()
+            b = AudioRecorder()
+            a.cleanup()
+            a.cleanup()
+            pyaudio_cls.return_value.terminate.assert_not_called()
+            b.cleanup()
+            pyaudio_cls.return_value.terminate.assert_called_once()
@@ -0,0 +1,115 @@
+"""Tests for the CGEventTap hotkey listener."""
+
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+sys.modules.setdefault("Quartz", MagicMock())
+sys.modules.setdefault("AppKit", MagicMock())
+sys.modules.setdefault("PyObjCTools", MagicMock())
+
+# ruff: noqa: E402 - Module import must come after mocks
+import kuiskaus.hotkey_listener_cgevent as cgevent
+from kuiskaus.hotkey_listener_cgevent import (
+    HotkeyListenerCGEvent,
+    kCGEventFlagMaskAlternate,
+    kCGEventFlagMaskCommand,
+    kCGEventFlagMaskControl,
+)
+
+
+class TestCheckModifiers:
+    def setup_method(self):
+        self.listeners = []
+
+    def teardown_method(self):
+        for listener in self.listeners:
+            listener.stop()
+
+    def _make_listener(self):
+        listener = HotkeyListenerCGEvent(on_press=MagicMock(), on_release=MagicMock())
+        self.listeners.append(listener)
+        return listener
+
+    def test_control_option_pressed(self):
+        listener = self._make_listener()
+        flags = kCGEventFlagMaskControl | kCGEventFlagMaskAlternate
+        assert listener._check_modifiers(flags)
+
+    def test_extra_unrelated_flags_ignored(self):
+        listener = self._make_listener()
+        flags = kCGEventFlagMaskControl | kCGEventFlagMaskAlternate | (1 << 8)
+        assert listener._check_modifiers(flags)
+
+    def test_command_blocks_hotkey(self):
+        listener = self._make_listener()
+        flags = (
+            kCGEventFlagMaskControl
+            | kCGEventFlagMaskAlternate
+            | kCGEventFlagMaskCommand
+        )
+        assert not listener._check_modifiers(flags)
+
+    def test_single_modifier_not_enough(self):
+        listener = self._make_listener()
+        assert not listener._check_modifiers(kCGEventFlagMaskControl)
+        assert not listener._check_modifiers(kCGEventFlagMaskAlternate)
+        assert not listener._check_modifiers(0)
+
+
+class TestEventTapCallback:
+    HOTKEY = kCGEventFlagMaskControl | kCGEventFlagMaskAlternate
+
+    def test_non_flags_event_skips_flag_lookup(self):
+        listener = HotkeyListenerCGEvent(on_press=MagicMock(), on_release=MagicMock())
+        event = object()
+        with patch.object(cgevent.Quartz, "CGEventGetFlags") as get_flags:
+            result = listener._event_tap_callback(None, object(), event, None)
+        listener.stop()
+        assert result is event
+        get_flags.assert_not_called()
+
+    def test_press_and_release_run_callbacks_in_order(self):
+        calls = []
+        done = threading.Event()
+        listener = HotkeyListenerCGEvent(
+            on_press=lambda: calls.append("press"),
+            on_release=lambda: (calls.append("release"), done.set()),
+        )
+        flags_changed = cgevent.Quartz.kCGEventFlagsChanged
+        with patch.object(
+            cgevent.Quartz, "CGEventGetFlags", side_effect=[self.HOTKEY, 0]
+        ):
+            listener._event_tap_callback(None, flags_changed, None, None)
+            listener._event_tap_callback(None, flags_changed, None, None)
+        assert done.wait(timeout=1)
+        listener.stop()
+        assert calls == ["press", "release"]
+
+
+class TestCallbackWorker:
+    def test_callback_error_is_logged_with_traceback_and_worker_survives(self):
+        done = threading.Event()
+
+        def fail():
+            raise RuntimeError("recorder failed")
+
+        listener = HotkeyListenerCGEvent(on_press=fail, on_release=done.set)
+        with patch.object(cgevent.logger, "exception") as log_exception:
+            listener._callback_queue.put(listener.on_press)
+            listener._callback_queue.put(listener.on_release)
+            assert done.wait(timeout=1)
+        listener.stop()
+        log_exception.assert_called_once_with("Error in hotkey callback")
+
+    def test_stop_ends_worker_after_queued_callbacks(self):
+        calls = []
+        listener = HotkeyListenerCGEvent(
+            on_press=lambda: calls.append("press"), on_release=MagicMock()
+        )
+        worker = listener._callback_thread
+        listener._callback_queue.put(listener.on_press)
+        listener.stop()
+        worker.join(timeout=1)
+        assert not worker.is_alive()
+        assert calls == ["press"]
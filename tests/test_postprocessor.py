@@ -7,7 +7,6 @@ from unittest.mock import MagicMock, patch
 
 sys.modules["pyaudio"] = MagicMock()
 sys.modules["mlx_whisper"] = MagicMock()
-sys.modules["numpy"] = MagicMock()
 
 # ruff: noqa: E402 - Module import must come after mocks
 from kuiskaus.postprocessor import (
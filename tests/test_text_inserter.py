@@ -0,0 +1,67 @@
+"""Tests for TextInserter."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.modules.setdefault("Quartz", MagicMock())
+sys.modules.setdefault("AppKit", MagicMock())
+
+# ruff: noqa: E402 - Module import must come after mocks
+import kuiskaus.text_inserter as text_inserter
+from kuiskaus.text_inserter import TextInserter
+
+
+class TestInsertTextTyping:
+    def _typed_strings(self, text):
+        with (
+            patch.object(text_inserter, "Quartz") as quartz,
+            patch.object(text_inserter.time, "sleep"),
+        ):
+            TextInserter().insert_text_typing(text)
+        calls = quartz.CGEventKeyboardSetUnicodeString.call_args_list
+        for c in calls:
+            assert c.args[1] == len(c.args[2].encode("utf-16-le")) // 2 <= 20
+        return [c.args[2] for c in calls], quartz.CGEventPost.call_count
+
+    def test_short_text_posts_one_event_pair(self):
+        typed, posts = self._typed_strings("hello world")
+        assert typed == ["hello world", "hello world"]
+        assert posts == 2
+
+    def test_long_text_is_sent_in_20_char_chunks(self):
+        text = "x" * 45
+        typed, posts = self._typed_strings(text)
+        assert "".join(typed[::2]) == text
+        assert max(len(t) for t in typed) == 20
+        assert posts == 6
+
+    def test_chunks_count_utf16_units_and_keep_surrogate_pairs(self):
+        text = "x" * 19 + "😀" + "y"
+        typed, posts = self._typed_strings(text)
+        assert typed[::2] == ["x" * 19, "😀y"]
+        assert posts == 4
+
+
+class TestEventSource:
+    def test_paste_reuses_one_event_source(self):
+        with patch.object(text_inserter, "Quartz") as quartz:
+            inserter = TextInserter()
+            inserter._simulate_paste()
+        quartz.CGEventSourceCreate.assert_called_once()
+        sources = {c.args[0] for c in quartz.CGEventCreateKeyboardEvent.call_args_list}
+        assert sources == {quartz.CGEventSourceCreate.return_value}
+
+
+class TestInsertTextPaste:
+    def test_paste_only_waits_after_cmd_v(self):
+        pasteboard = MagicMock()
+        pasteboard.stringForType_.return_value = None
+        with (
+            patch.object(text_inserter, "Quartz"),
+            patch.object(text_inserter, "NSPasteboard") as ns_pasteboard,
+            patch.object(text_inserter.time, "sleep") as sleep,
+        ):
+            ns_pasteboard.generalPasteboard.return_value = pasteboard
+            TextInserter().insert_text_paste("hello")
+        pasteboard.setString_forType_.assert_called_once()
+        assert [c.args[0] for c in sleep.call_args_list] == [0.1]
@@ -0,0 +1,140 @@
+"""Tests for WhisperTranscriber."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+sys.modules["pyaudio"] = MagicMock()
+sys.modules.setdefault("mlx", MagicMock())
+sys.modules.setdefault("mlx.core", MagicMock())
+sys.modules["mlx_whisper"] = MagicMock()
+sys.modules["mlx_whisper.load_models"] = MagicMock()
+sys.modules["mlx_whisper.transcribe"] = MagicMock()
+
+# ruff: noqa: E402 - Module import must come after mocks
+import kuiskaus.whisper_transcriber as whisper_transcriber
+from kuiskaus.whisper_transcriber import WhisperTranscriber
+
+
+class TestWhisperTranscriber:
+    def _make_transcriber(self, model_name="turbo"):
+        with patch.object(WhisperTranscriber, "_load_model"):
+            t = WhisperTranscriber(model_name=model_name)
+        t.load_thread.join(timeout=1)
+        t._loaded.set()
+        return t
+
+    def test_model_path_resolved_at_init(self):
+        assert (
+            self._make_transcriber("large").model_path
+            == "mlx-community/whisper-large-v3"
+        )
+        assert self._make_transcriber("tiny").model_path == "mlx-community/whisper-tiny"
+
+    def test_turbo_defaults_to_quantized_weights(self):
+        assert self._make_transcriber("turbo").model_path.endswith("-q4")
+        assert (
+            self._make_transcriber("turbo-fp16").model_path
+            == "mlx-community/whisper-large-v3-turbo"
+        )
+
+    def test_load_model_populates_mlx_model_cache(self):
+        t = self._make_transcriber()
+        with (
+            patch.object(whisper_transcriber, "ModelHolder") as holder,
+            patch.object(whisper_transcriber, "mlx_whisper"),
+        ):
+            t._load_model()
+        holder.get_model.assert_called_once()
+        assert holder.get_model.call_args.args[0] == t.model_path
+        assert t.model is holder.get_model.return_value
+
+    def test_load_model_runs_warmup_pass(self):
+        t = self._make_transcriber()
+        with (
+            patch.object(whisper_transcriber, "ModelHolder"),
+            patch.object(whisper_transcriber, "mlx_whisper") as mlx_whisper,
+        ):
+            t._load_model()
+        mlx_whisper.transcribe.assert_called_once()
+        call = mlx_whisper.transcribe.call_args
+        assert not call.args[0].any()
+        assert call.kwargs["path_or_hf_repo"] == t.model_path
+        assert call.kwargs["temperature"] == t._default_mlx_kwargs["temperature"]
+        assert call.kwargs["verbose"] is None
+
+    def test_transcribe_uses_cached_model_path(self):
+        t = self._make_transcriber()
+        with patch.object(whisper_transcriber, "mlx_whisper") as mlx_whisper:
+            mlx_whisper.transcribe.return_value = {"text": "hello"}
+            result = t.transcribe(np.zeros(16000, dtype=np.float32))
+        assert result["text"] == "hello"
+        kwargs = mlx_whisper.transcribe.call_args.kwargs
+        assert kwargs["path_or_hf_repo"] == t.model_path
+
+    def test_transcribe_empty_audio_skips_model(self):
+        t = self._make_transcriber()
+        with patch.object(whisper_transcriber, "mlx_whisper") as mlx_whisper:
+            result = t.transcribe(np.array([], dtype=np.float32))
+        assert result["text"] == ""
+        mlx_whisper.transcribe.assert_not_called()
+
+    def test_transcribe_pads_short_audio(self):
+        t = self._make_transcriber()
+        with patch.object(whisper_transcriber, "mlx_whisper") as mlx_whisper:
+            mlx_whisper.transcribe.return_value = {"text": ""}
+            t.transcribe(np.full(1600, 0.5, dtype=np.float32))
+            t.transcribe(np.ones(10, dtype=np.float32))
+        audio = mlx_whisper.transcribe.call_args.args[0]
+        assert len(audio) == 1600
+        assert audio.dtype == np.float32
+        assert list(audio[:10]) == [1.0] * 10
+        assert not audio[10:].any()
+
+    def test_transcribe_passes_float32_audio_through(self):
+        t = self._make_transcriber()
+        audio = np.zeros(16000, dtype=np.float32)
+        with patch.object(whisper_transcriber, "mlx_whisper") as mlx_whisper:
+            mlx_whisper.transcribe.return_value = {"text": ""}
+            t.transcribe(audio)
+        assert mlx_whisper.transcribe.call_args.args[0] is audio
+
+    def test_transcribe_does_not_hold_model_lock(self):
+        t = self._make_transcriber()
+        with patch.object(whisper_transcriber, "mlx_whisper") as mlx_whisper:
+            mlx_whisper.transcribe.side_effect = lambda *a, **k: {
+                "text": str(t.model_lock.locked())
+            }
+            result = t.transcribe(np.zeros(16000, dtype=np.float32))
+        assert result["text"] == "False"
+
+    def test_transcribe_kwargs_override_defaults(self):
+        t = self._make_transcriber()
+        with patch.object(whisper_transcriber, "mlx_whisper") as mlx_whisper:
+            mlx_whisper.transcribe.return_value = {"text": ""}
+            t.transcribe(np.zeros(16000, dtype=np.float32), temperature=0.2)
+        kwargs = mlx_whisper.transcribe.call_args.kwargs
+        assert kwargs["temperature"] == 0.2
+        assert kwargs["no_speech_threshold"] == 0.6
+        assert t._default_mlx_kwargs["temperature"] == 0.0
+
+    def test_load_model_signals_loaded_even_on_failure(self):
+        t = self._make_transcriber()
+        t._loaded.clear()
+        with patch.object(whisper_transcriber, "ModelHolder") as holder:
+            holder.get_model.side_effect = RuntimeError("download failed")
+            try:
+                t._load_model()
+            except RuntimeError:
+                pass
+        assert t._loaded.is_set()
+
+    def test_transcribe_converts_non_float32_audio(self):
+        t = self._make_transcriber()
+        with patch.object(whisper_transcriber, "mlx_whisper") as mlx_whisper:
+            mlx_whisper.transcribe.return_value = {"text": ""}
+            t.transcribe(np.zeros(32000, dtype=np.float64)[::2])
+        audio = mlx_whisper.transcribe.call_args.args[0]
+        assert audio.dtype == np.float32
+        assert audio.flags.c_contiguous